@@ -1,284 +1,266 @@
-"""
-XML to CSV Converter for General Data
-
-Author: Keith Satuku
-
-Description:
-This script reads an XML file containing General data, extracts relevant details from the XML structure,
-and converts it to a structured JSON format. The script then processes the JSON data to create a DataFrame and saves it as a CSV file.
-The script handles nested XML elements such as ports, sections, tables, and PAR elements to produce a detailed JSON file.
-
-Usage:
-The script takes an XML file as input (e.g., 'General.xml') and outputs a corresponding CSV file (e.g., 'General.csv').
-
-Functions:
-- parse_port(port_element): Parses an individual port element from the XML.
-- parse_xml_to_json(xml_file): Parses the entire XML file and converts it to JSON format.
-- process_json_to_csv(json_data, csv_file): Processes the JSON data to create a DataFrame and saves it as a CSV file.
-
-"""
-
-import xml.etree.ElementTree as ET
-import json
-import pandas as pd
-import ast
-
-class XMLToCSVConverter:
-    """
-    A class to convert XML data into CSV by parsing nested elements
-    (ports, sections, tables, and PAR elements) and processing the
-    structured data into a pandas DataFrame.
-    """
-    
-    def __init__(self, xml_file: str, csv_file: str):
-        """
-        Initializes the converter with file paths.
-
-        Args:
-            xml_file (str): The path to the source XML file.
-            csv_file (str): The path where the CSV file should be saved.
-        """
-        self.xml_file = xml_file
-        self.csv_file = csv_file
-
-    def parse_port(self, port_element):
-        """
-        Parses an individual port element from the XML and extracts port details, including sections, tables, and PARs.
-
-        Args:
-            port_element (xml.etree.ElementTree.Element): An XML element representing a port.
-
-        Returns:
-            dict: A dictionary containing the parsed port data with keys such as 'PortName', 'PortID', 'WorldPortNumber', and 'Sections'.
-        """
-        port_data = {
-            'PortName': port_element.find('PortName').text,
-            'PortID': port_element.find('PortID').text,
-            'WorldPortNumber': port_element.find('WorldPortNumber').text,
-            'Sections': []
-        }
-
-        for section in port_element.findall('Section'):
-            section_data = {
-                'SectionHeader': section.find('SectionHeader').text,
-                'ID': section.find('SectionHeader').get('ID'),
-                'Tables': [],
-                'PARs': []
-            }
-
-            for table in section.findall('table'):
-                table_data = {
-                    'ID': table.get('ID'),
-                    'updatedate': table.get('updatedate'),
-                    'Rows': []
-                }
-
-                for row in table.findall('.//row'):
-                    row_data = []
-                    for entry in row.findall('entry'):
-                        para = entry.find('para')
-                        if 'namest' in entry.attrib and 'nameend' in entry.attrib:
-                            row_data.append({
-                                'span': True,
-                                'text': para.text if para is not None else ''
-                            })
-                        else:
-                            row_data.append(para.text if para is not None else '')
-                    table_data['Rows'].append(row_data)
-
-                section_data['Tables'].append(table_data)
-
-            for par in section.findall('PAR'):
-                par_data = {
-                    'ID': par.get('ID'),
-                    'updatedate': par.get('updatedate'),
-                    'Text': par.text
-                }
-                section_data['PARs'].append(par_data)
-
-            port_data['Sections'].append(section_data)
-
-        return port_data
-
-    def parse_xml_to_json(self):
-        """
-        Parses an entire XML file containing port data and converts it to a JSON-like list of dictionaries.
-
-        Returns:
-            list: A list of dictionaries representing the parsed port data, or None if an error occurs.
-        """
-        try:
-            tree = ET.parse(self.xml_file)
-            root = tree.getroot()
-            print(f"Root tag: {root.tag}")
-
-            # Debug: Print all child tags of the root
-            for child in root:
-                print(f"Child tag: {child.tag}")
-
-            ports_data = []
-            for group in root.findall('Group'):
-                for port in group.findall('Port'):
-                    ports_data.append(self.parse_port(port))
-
-            return ports_data
-        except ET.ParseError as e:
-            print(f"Error parsing XML: {e}")
-        except FileNotFoundError:
-            print(f"File not found: {self.xml_file}")
-        except Exception as e:
-            print(f"An error occurred: {e}")
-
-    def intermediate_to_next(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        An internal method that processes selected columns (containing JSON-like data)
-        and flattens their structure into separate rows, update dates, and PAR texts.
-
-        Args:
-            df (pd.DataFrame): DataFrame containing columns of JSON-like data.
-
-        Returns:
-            pd.DataFrame: A new DataFrame with parsed rows, update dates, and paragraph data.
-        """
-        # Initialize a dictionary to store processed data
-        processed_data = {}
-        columns_to_process = [
-            "Repairs", "Drydocks", "Bunkers/water/stores", "Medical facilities",
-            "Transport", "Crew change", "Consuls", "Public holidays",
-            "Working hours", "Fumigation", "Pollution", "Developments",
-            "Officials and visitors", "Banks", "Recreation", "Seaman's Mission"
-        ]
-
-        for col in columns_to_process:
-            rows_list = []
-            update_dates = []
-            pars_list = []
-
-            for entry in df[col]:
-                try:
-                    # Parse the JSON-like structure in the cell
-                    if isinstance(entry, str):
-                        data = ast.literal_eval(entry)
-                    elif isinstance(entry, dict):
-                        data = entry
-                    elif entry is None:
-                        rows_list.append(None)
-                        update_dates.append(None)
-                        pars_list.append({})
-                        continue
-
-                    # Extract Tables
-                    try:
-                        if 'Tables' in data and data['Tables']:
-                            tables = data['Tables']
-                            rows = tables[0].get('Rows', [])
-                            updatedate = tables[0].get('updatedate', None)
-                            rows_list.append(rows)
-                            update_dates.append(updatedate)
-                        else:
-                            rows_list.append(None)
-                            update_dates.append(None)
-                    except (KeyError, UnboundLocalError) as e:
-                        print(f"Error parsing data for Tables: {entry}. Error: {e}")
-
-                    # Extract PARs
-                    try:
-                        if 'PARs' in data and data['PARs']:
-                            pars = data['PARs'][0]
-                            if isinstance(pars, str):
-                                pars_dict = ast.literal_eval(pars)
-                            elif isinstance(pars, dict):
-                                pars_dict = pars
-                            pars_dict = {k: pars_dict[k] for k in ['updatedate', 'Text'] if k in pars_dict}
-                            pars_list.append(pars_dict)
-                        else:
-                            pars_list.append({})
-                    except Exception as e:
-                        print(f"Error parsing data for Paragraphs: {entry}. Error: {e}")
-                        pars_list.append({})
-
-                except (ValueError, SyntaxError, KeyError) as e:
-                    print(f"Error parsing data for entry: {entry}. Error: {e}")
-                    rows_list.append(None)
-                    update_dates.append(None)
-                    pars_list.append({})
-
-            # Store the processed data in new columns
-            processed_data[f"{col}"] = rows_list
-            processed_data[f"{col}UpdateDate"] = update_dates
-            processed_data[f"{col}PARs"] = pars_list
-
-        # Convert the processed data dictionary to a DataFrame
-        processed_df = pd.DataFrame(processed_data)
-
-        # Columns we want to keep from the original DataFrame
-        trimming_columns = ['PortName', 'PortID', 'WorldPortNumber']
-        trimmed_df = df[trimming_columns]
-        
-        # Merge with the processed columns
-        final_df = pd.concat([trimmed_df, processed_df], axis=1)
-
-        return final_df
-
-    def process_json_to_csv(self, json_data):
-        """
-        Processes the JSON data to create a DataFrame and saves it as a CSV file.
-
-        Args:
-            json_data (list): A list of dictionaries representing the parsed port data.
-        """
-        processed_data = []
-
-        # Iterate through each port entry in the JSON data
-        for port in json_data:
-            port_info = {
-                'PortName': port['PortName'],
-                'PortID': port['PortID'],
-                'WorldPortNumber': port['WorldPortNumber']
-            }
-            
-            # Iterate through each section in the "Sections" object
-            for section in port['Sections']:
-                section_header = section['SectionHeader']
-                port_info[section_header] = section
-            
-            processed_data.append(port_info)
-
-        # Create a DataFrame from the processed data
-        df = pd.DataFrame(processed_data)
-        df_two = self.intermediate_to_next(df)
-
-        # Save the DataFrame to a CSV file
-        df_two.to_csv(self.csv_file, index=False)
-        print(f"CSV data written to {self.csv_file}")
-
-    def run(self):
-        """
-        High-level method to orchestrate the XML-to-CSV conversion.
-        """
-        print(f"Reading file: {self.xml_file}")
-        json_data = self.parse_xml_to_json()
-
-        if json_data:
-            self.process_json_to_csv(json_data)
-        else:
-            print("No data to write to CSV")
-
-
-def main():
-    """
-    Main execution block.
-
-    Reads an XML file ('General.xml'), parses it to JSON format, processes
-    the JSON data to create a DataFrame, and writes the resulting DataFrame
-    to 'General_old.csv'.
-    """
-    xml_file = 'General.xml'
-    csv_file = 'General.csv'
-    
-    converter = XMLToCSVConverter(xml_file, csv_file)
-    converter.run()
-
-
-if __name__ == "__main__":
-    main()
+"""
+XML to CSV Converter for General Data
+
+Author: Keith Satuku
+
+Description:
+This script reads an XML file containing General data, extracts relevant details from the XML structure,
+and converts it to a structured JSON format. The script then processes the JSON data to create a DataFrame and saves it as a CSV file.
+The script handles nested XML elements such as ports, sections, tables, and PAR elements to produce a detailed JSON file.
+
+Usage:
+The script takes an XML file as input (e.g., 'General.xml') and outputs a corresponding CSV file (e.g., 'General.csv').
+
+Functions:
+- parse_port(port_element): Parses an individual port element from the XML.
+- parse_xml_to_json(xml_file): Parses the entire XML file and converts it to JSON format.
+- process_json_to_csv(json_data, csv_file): Processes the JSON data to create a DataFrame and saves it as a CSV file.
+
+"""
+
+import xml.etree.ElementTree as ET
+import json
+import pandas as pd
+import polars as pl
+
+
+def _stringify_cell(value):
+    """
+    Prepares an object-column cell for CSV writing: nested lists/dicts become
+    their repr (matching what pandas' writer produced), missing values stay
+    missing, and strings pass through untouched.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and value != value:  # NaN from column alignment
+        return None
+    return repr(value)
+
+
+class XMLToCSVConverter:
+    """
+    A class to convert XML data into CSV by parsing nested elements
+    (ports, sections, tables, and PAR elements) and processing the
+    structured data into a pandas DataFrame.
+    """
+    
+    def __init__(self, xml_file: str, csv_file: str):
+        """
+        Initializes the converter with file paths.
+
+        Args:
+            xml_file (str): The path to the source XML file.
+            csv_file (str): The path where the CSV file should be saved.
+        """
+        self.xml_file = xml_file
+        self.csv_file = csv_file
+
+    def parse_port(self, port_element):
+        """
+        Parses an individual port element from the XML and extracts port details, including sections, tables, and PARs.
+
+        Args:
+            port_element (xml.etree.ElementTree.Element): An XML element representing a port.
+
+        Returns:
+            dict: A dictionary containing the parsed port data with keys such as 'PortName', 'PortID', 'WorldPortNumber', and 'Sections'.
+        """
+        port_data = {
+            'PortName': port_element.find('PortName').text,
+            'PortID': port_element.find('PortID').text,
+            'WorldPortNumber': port_element.find('WorldPortNumber').text,
+            'Sections': []
+        }
+
+        for section in port_element.findall('Section'):
+            section_data = {
+                'SectionHeader': section.find('SectionHeader').text,
+                'ID': section.find('SectionHeader').get('ID'),
+                'Tables': [],
+                'PARs': []
+            }
+
+            for table in section.findall('table'):
+                table_data = {
+                    'ID': table.get('ID'),
+                    'updatedate': table.get('updatedate'),
+                    'Rows': []
+                }
+
+                for row in table.findall('.//row'):
+                    row_data = []
+                    for entry in row.findall('entry'):
+                        para = entry.find('para')
+                        if 'namest' in entry.attrib and 'nameend' in entry.attrib:
+                            row_data.append({
+                                'span': True,
+                                'text': para.text if para is not None else ''
+                            })
+                        else:
+                            row_data.append(para.text if para is not None else '')
+                    table_data['Rows'].append(row_data)
+
+                section_data['Tables'].append(table_data)
+
+            for par in section.findall('PAR'):
+                par_data = {
+                    'ID': par.get('ID'),
+                    'updatedate': par.get('updatedate'),
+                    'Text': par.text
+                }
+                section_data['PARs'].append(par_data)
+
+            port_data['Sections'].append(section_data)
+
+        return port_data
+
+    def parse_xml_to_json(self):
+        """
+        Parses an entire XML file containing port data and converts it to a JSON-like list of dictionaries.
+
+        Returns:
+            list: A list of dictionaries representing the parsed port data, or None if an error occurs.
+        """
+        try:
+            tree = ET.parse(self.xml_file)
+            root = tree.getroot()
+            print(f"Root tag: {root.tag}")
+
+            # Debug: Print all child tags of the root
+            for child in root:
+                print(f"Child tag: {child.tag}")
+
+            ports_data = []
+            for group in root.findall('Group'):
+                for port in group.findall('Port'):
+                    ports_data.append(self.parse_port(port))
+
+            return ports_data
+        except ET.ParseError as e:
+            print(f"Error parsing XML: {e}")
+        except FileNotFoundError:
+            print(f"File not found: {self.xml_file}")
+        except Exception as e:
+            print(f"An error occurred: {e}")
+
+    def process_json_to_csv(self, json_data):
+        """
+        Processes the JSON data to create a DataFrame and saves it as a CSV file.
+
+        The ports are walked exactly once: as each port's sections are
+        visited, the table rows, update dates, and PAR texts are appended
+        straight onto flat per-column lists. This fuses what used to be two
+        full traversals (one building a DataFrame of section dicts, one
+        unpacking every cell of it again) into a single pass with no
+        intermediate dict-valued columns.
+
+        Args:
+            json_data (list): A list of dictionaries representing the parsed port data.
+        """
+        columns_to_process = [
+            "Repairs", "Drydocks", "Bunkers/water/stores", "Medical facilities",
+            "Transport", "Crew change", "Consuls", "Public holidays",
+            "Working hours", "Fumigation", "Pollution", "Developments",
+            "Officials and visitors", "Banks", "Recreation", "Seaman's Mission"
+        ]
+
+        # The schema is fixed up front, so every column can be preallocated at
+        # full length and filled by index: ports missing a section are never
+        # touched and simply keep their placeholder. The shared empty dict is
+        # a read-only sentinel — cells with real PAR data are reassigned, so
+        # it is never mutated.
+        ports = list(json_data)
+        n = len(ports)
+        empty_pars = {}
+        port_names = [None] * n
+        port_ids = [None] * n
+        world_port_numbers = [None] * n
+        header_rows = {col: [None] * n for col in columns_to_process}
+        header_dates = {col: [None] * n for col in columns_to_process}
+        header_pars = {col: [empty_pars] * n for col in columns_to_process}
+
+        # Iterate through each port entry in the JSON data
+        for i, port in enumerate(ports):
+            port_names[i] = port['PortName']
+            port_ids[i] = port['PortID']
+            world_port_numbers[i] = port['WorldPortNumber']
+
+            for section in port['Sections']:
+                col = section['SectionHeader']
+                rows_col = header_rows.get(col)
+                if rows_col is None:
+                    # Not one of the processed section headers
+                    continue
+
+                # Extract Tables
+                tables = section.get('Tables')
+                if tables:
+                    first_table = tables[0]
+                    rows_col[i] = first_table.get('Rows', [])
+                    header_dates[col][i] = first_table.get('updatedate', None)
+
+                # Extract PARs
+                pars = section.get('PARs')
+                if pars:
+                    pars_dict = pars[0]
+                    header_pars[col][i] = {k: pars_dict[k] for k in ['updatedate', 'Text'] if k in pars_dict}
+
+        # Assemble the flat columns into the final DataFrame in one shot
+        final_data = {
+            'PortName': port_names,
+            'PortID': port_ids,
+            'WorldPortNumber': world_port_numbers
+        }
+        for col in columns_to_process:
+            final_data[f"{col}"] = header_rows[col]
+            final_data[f"{col}UpdateDate"] = header_dates[col]
+            final_data[f"{col}PARs"] = header_pars[col]
+
+        df_two = pd.DataFrame(final_data)
+
+        # Back the pure-string columns with Arrow dtypes: contiguous UTF-8
+        # buffers take a fraction of the memory of object arrays and write
+        # out faster. Columns holding lists/dicts stay as objects.
+        string_columns = ['PortName', 'PortID', 'WorldPortNumber']
+        string_columns += [col for col in df_two.columns if col.endswith('UpdateDate')]
+        df_two = df_two.astype({col: 'string[pyarrow]' for col in string_columns})
+
+        # Stringify the nested list/dict cells (CSV cannot hold them anyway)
+        # and hand the write to Polars, whose thread-parallel Rust CSV writer
+        # dumps the columnar buffers far faster than DataFrame.to_csv
+        object_columns = df_two.columns[df_two.dtypes == object]
+        for col in object_columns:
+            df_two[col] = df_two[col].map(_stringify_cell)
+        pl.from_pandas(df_two).write_csv(self.csv_file)
+        print(f"CSV data written to {self.csv_file}")
+
+    def run(self):
+        """
+        High-level method to orchestrate the XML-to-CSV conversion.
+        """
+        print(f"Reading file: {self.xml_file}")
+        json_data = self.parse_xml_to_json()
+
+        if json_data:
+            self.process_json_to_csv(json_data)
+        else:
+            print("No data to write to CSV")
+
+
+def main():
+    """
+    Main execution block.
+
+    Reads an XML file ('General.xml'), parses it to JSON format, processes
+    the JSON data to create a DataFrame, and writes the resulting DataFrame
+    to 'General_old.csv'.
+    """
+    xml_file = 'General.xml'
+    csv_file = 'General.csv'
+    
+    converter = XMLToCSVConverter(xml_file, csv_file)
+    converter.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+"""
+Shared XML to CSV Conversion Core for IHS Port Data
+
+Author: Keith Satuku
+
+Description:
+This module holds the XML-to-CSV pipeline shared by the per-category entry
+scripts (berths and cargo, navigation). All IHS port exports share the same
+structure — ports containing sections, tables, and PAR elements — so the
+parsing, flattening, and CSV streaming live here once; the only per-schema
+difference is how section columns are named, which the entry scripts pass to
+the constructor.
+
+Usage:
+Entry scripts instantiate IHSXmlToCsv with their input XML and output CSV
+paths (e.g. 'Navigation.xml' -> 'Navigation.csv') and call run().
+
+Classes:
+- IHSXmlToCsv: Streams an IHS port XML file and writes it out as CSV.
+- DataProcessor: Processes nested section structures into flat row values.
+
+"""
+
+import csv
+import lxml.etree as ET
+import orjson
+import pandas as pd
+import ast
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from sys import intern
+
+# Ports handed to each worker process at a time; large enough to amortize the
+# pickling/IPC cost of a task, small enough to keep all workers busy.
+_PARALLEL_CHUNK_SIZE = 64
+
+
+def _intern_or_none(value):
+    """Interns a string so repeated values share one object; None passes through."""
+    return intern(value) if value is not None else None
+
+
+def _parse_port_chunk(chunk: list)-> list:
+    """
+    Worker-process task: re-parses serialized <Port> subtrees into port dicts.
+
+    Args:
+        chunk (list): Serialized <Port> elements as bytes.
+
+    Returns:
+        list: Parsed port dicts in the same order.
+    """
+    return [IHSXmlToCsv.parse_port(ET.fromstring(xml_bytes)) for xml_bytes in chunk]
+
+# Parser configuration shared by every parse of an IHS export. lxml coalesces
+# adjacent character data natively (the equivalent of expat's buffer_text), so
+# long <para>/<PAR> bodies always arrive as a single string; huge_tree lifts
+# libxml2's input limits for very large files and collect_ids skips
+# ID-attribute indexing we never query.
+_ITERPARSE_OPTS = {
+    'events': ('end',),
+    'tag': 'Port',
+    'huge_tree': True,
+    'collect_ids': False,
+}
+
+class IHSXmlToCsv:
+    """
+    A class to handle XML to CSV conversion for IHS port data.
+
+    Attributes:
+        xml_file (str): Path to the XML file to be parsed.
+        csv_file (str): Path to the output CSV file.
+    """
+
+    def __init__(self, xml_file: str, csv_file: str, max_workers: int = None,
+                 rows_suffix: str = 'Rows')-> None:
+        """
+        Initializes the converter with the XML and CSV file paths.
+
+        Args:
+            xml_file (str): Path to the input XML file.
+            csv_file (str): Path to the output CSV file.
+            max_workers (int): Number of worker processes for parsing ports;
+                               None or 1 keeps everything in this process.
+            rows_suffix (str): Suffix for the table-rows column of each section
+                               ('Rows' gives '<Header>Rows'; '' keeps the bare
+                               header, as the navigation schema does).
+        """
+        self.xml_file = xml_file
+        self.csv_file = csv_file
+        self.max_workers = max_workers
+        self.rows_suffix = rows_suffix
+
+    @staticmethod
+    def parse_port(port_element: ET.Element)-> dict:
+        """
+        Parses an individual port element from the XML and extracts port details.
+
+        Args:
+            port_element (xml.etree.ElementTree.Element): An XML element representing a port.
+
+        Returns:
+            dict: A dictionary containing parsed port data, including sections, tables, and PARs.
+        """
+        # Each find/findall is a linear scan over the same child list, so the
+        # port and its sections are instead walked exactly once, dispatching
+        # on the tag of each child as it comes up.
+        port_data = {
+            'PortName': None,
+            'PortID': None,
+            'WorldPortNumber': None,
+            'Sections': []
+        }
+
+        for child in port_element:
+            tag = child.tag
+            if tag == 'PortName':
+                port_data['PortName'] = child.text
+            elif tag == 'PortID':
+                port_data['PortID'] = child.text
+            elif tag == 'WorldPortNumber':
+                port_data['WorldPortNumber'] = child.text
+            elif tag == 'Section':
+                port_data['Sections'].append(IHSXmlToCsv._parse_section(child))
+
+        return port_data
+
+    @staticmethod
+    def _parse_section(section: ET.Element)-> dict:
+        """
+        Parses a single section element in one pass over its children.
+
+        Args:
+            section (xml.etree.ElementTree.Element): An XML element representing a section.
+
+        Returns:
+            dict: Parsed section data with its header, tables, and PARs.
+        """
+        section_data = {
+            'SectionHeader': None,
+            'ID': None,
+            'Tables': [],
+            'PARs': []
+        }
+
+        for child in section:
+            tag = child.tag
+            if tag == 'SectionHeader':
+                # Headers, IDs, and update dates repeat across thousands of
+                # ports; interning collapses the duplicates to one object each
+                section_data['SectionHeader'] = _intern_or_none(child.text)
+                section_data['ID'] = _intern_or_none(child.get('ID'))
+            elif tag == 'table':
+                table_data = {
+                    'ID': _intern_or_none(child.get('ID')),
+                    'updatedate': _intern_or_none(child.get('updatedate')),
+                    'Rows': []
+                }
+
+                # iter/iterchildren filter by tag in C, so the hot row/entry
+                # loops never parse a path expression per call the way
+                # find/findall do. The append methods and entry.attrib are
+                # bound to locals because this triple loop dominates the
+                # profile and every attribute fetch here is paid per cell
+                # (lxml builds a fresh attrib mapping on each access).
+                rows = table_data['Rows']
+                for row in child.iter('row'):
+                    row_data = []
+                    cell_append = row_data.append
+                    for entry in row.iterchildren('entry'):
+                        para = next(entry.iterchildren('para'), None)
+                        attrib = entry.attrib
+                        if 'namest' in attrib and 'nameend' in attrib:
+                            cell_append({
+                                'span': True,
+                                'text': para.text if para is not None else ''
+                            })
+                        else:
+                            cell_append(para.text if para is not None else '')
+                    rows.append(row_data)
+
+                section_data['Tables'].append(table_data)
+            elif tag == 'PAR':
+                section_data['PARs'].append({
+                    'ID': _intern_or_none(child.get('ID')),
+                    'updatedate': _intern_or_none(child.get('updatedate')),
+                    'Text': child.text
+                })
+
+        return section_data
+
+    def parse_xml_to_json(self):
+        """
+        Streams the XML file and converts it to JSON format, one port at a time.
+
+        Rather than loading the whole document into memory, this iterates the
+        file with lxml's iterparse, parses each <Port> subtree as soon as it is
+        complete and clears it (plus any already-processed siblings) so memory
+        stays bounded regardless of file size.
+
+        Yields:
+            dict: Parsed data for each port in document order.
+        """
+        try:
+            if self.max_workers and self.max_workers > 1:
+                yield from self._parse_ports_parallel()
+                return
+            for _, port in ET.iterparse(self.xml_file, **_ITERPARSE_OPTS):
+                yield self.parse_port(port)
+                port.clear()
+                while port.getprevious() is not None:
+                    del port.getparent()[0]
+        except (ET.XMLSyntaxError, ET.ParseError) as e:
+            print(f"Error parsing XML: {e}")
+        except OSError:
+            print(f"File not found: {self.xml_file}")
+        except Exception as e:
+            print(f"An error occurred: {e}")
+
+    def _parse_ports_parallel(self):
+        """
+        Parses ports in a pool of worker processes.
+
+        The main process streams the file, ships each <Port> subtree to the
+        pool as serialized bytes in chunks, and yields results in submission
+        order so the output is identical to the serial path. Pending chunks
+        are bounded so memory stays limited even if workers fall behind.
+
+        Yields:
+            dict: Parsed data for each port in document order.
+        """
+        chunk = []
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            for _, port in ET.iterparse(self.xml_file, **_ITERPARSE_OPTS):
+                chunk.append(ET.tostring(port))
+                port.clear()
+                while port.getprevious() is not None:
+                    del port.getparent()[0]
+
+                if len(chunk) == _PARALLEL_CHUNK_SIZE:
+                    pending.append(pool.submit(_parse_port_chunk, chunk))
+                    chunk = []
+                    while len(pending) > self.max_workers * 2:
+                        yield from pending.popleft().result()
+
+            if chunk:
+                pending.append(pool.submit(_parse_port_chunk, chunk))
+            while pending:
+                yield from pending.popleft().result()
+
+    def _collect_section_headers(self)-> list:
+        """
+        First pass over the XML: collects the union of section headers.
+
+        Guarded like parse_xml_to_json so a malformed file degrades to the
+        no-data path instead of raising out of the writer.
+
+        Returns:
+            list: Section header texts in order of first appearance, or None
+                  if the file cannot be read.
+        """
+        try:
+            headers = {}
+            for _, port in ET.iterparse(self.xml_file, **_ITERPARSE_OPTS):
+                for section_header in port.iter('SectionHeader'):
+                    if section_header.text:
+                        headers.setdefault(section_header.text)
+                port.clear()
+                while port.getprevious() is not None:
+                    del port.getparent()[0]
+            return list(headers)
+        except (ET.XMLSyntaxError, ET.ParseError) as e:
+            print(f"Error parsing XML: {e}")
+        except OSError:
+            print(f"File not found: {self.xml_file}")
+        except Exception as e:
+            print(f"An error occurred: {e}")
+
+    def _flatten_port(self, port: dict)-> dict:
+        """
+        Flattens one parsed port into a single-level row dict.
+
+        Args:
+            port (dict): Parsed port data as returned by parse_port.
+
+        Returns:
+            dict: Row keyed on 'PortName', 'PortID', 'WorldPortNumber' and
+                  '<Header><rows_suffix>'/'<Header>UpdateDate'/'<Header>PARs'
+                  per section.
+        """
+        row = {
+            'PortName': port['PortName'],
+            'PortID': port['PortID'],
+            'WorldPortNumber': port['WorldPortNumber']
+        }
+
+        rows_suffix = self.rows_suffix
+        for section in port['Sections']:
+            header = section['SectionHeader']
+            if not header:
+                continue
+            DataProcessor._flatten_section(section, header, row, rows_suffix)
+
+        return row
+
+    @staticmethod
+    def _compile_row_builder(fieldnames: list):
+        """
+        Generates a row builder specialized for this file's exact column set.
+
+        The header set is fixed for a given IHS category once the first pass
+        has discovered it, so a function with every lookup inlined is generated
+        instead of looping over the headers for each port.
+
+        Args:
+            fieldnames (list): The CSV column names, in output order.
+
+        Returns:
+            callable: build_row(row) returning the cell values as a tuple,
+                      with missing PARs columns defaulting to ().
+        """
+        cells = []
+        for name in fieldnames:
+            if name.endswith('PARs'):
+                cells.append(f"get({name!r}, ())")
+            else:
+                cells.append(f"get({name!r})")
+        src = "def build_row(row):\n    get = row.get\n    return (" + ", ".join(cells) + ")\n"
+        namespace = {}
+        exec(src, namespace)
+        return namespace['build_row']
+
+    def process_json_to_csv(self, json_data)-> None:
+        """
+        Streams JSON data to a CSV file row by row.
+
+        A first pass over the XML collects the union of section headers so the
+        CSV header is known up front; each port is then flattened and written
+        as soon as it is parsed, so no DataFrame (or any other full
+        materialization of the data) is ever built.
+
+        Args:
+            json_data (iterable): Parsed JSON data from the XML, one dict per port.
+        """
+        json_data = iter(json_data)
+        first_port = next(json_data, None)
+        if first_port is None:
+            print("No data to write to CSV")
+            return
+
+        headers = self._collect_section_headers()
+        if headers is None:
+            print("No data to write to CSV")
+            return
+
+        fieldnames = ['PortName', 'PortID', 'WorldPortNumber']
+        for header in headers:
+            fieldnames.extend((f"{header}{self.rows_suffix}",
+                               f"{header}UpdateDate", f"{header}PARs"))
+        build_row = self._compile_row_builder(fieldnames)
+
+        with open(self.csv_file, 'w', newline='') as out:
+            writer = csv.writer(out, lineterminator='\n')
+            writer.writerow(fieldnames)
+            port = first_port
+            while port is not None:
+                writer.writerow(build_row(self._flatten_port(port)))
+                port = next(json_data, None)
+
+        print(f"CSV data written to {self.csv_file}")
+
+    def to_jsonl(self, path: str)-> None:
+        """
+        Streams the parsed ports to a newline-delimited JSON file.
+
+        For consumers that can take JSONL instead of CSV this skips the
+        flattening and CSV quoting entirely: each port dict is serialized with
+        orjson as soon as it is parsed and written as one line, preserving the
+        nested section/table structure exactly.
+
+        Args:
+            path (str): Path to the output JSONL file.
+        """
+        with open(path, 'wb') as out:
+            write = out.write
+            for port in self.parse_xml_to_json():
+                write(orjson.dumps(port) + b'\n')
+
+        print(f"JSONL data written to {path}")
+
+    def run(self)-> None:
+        """
+        Orchestrates the XML to CSV conversion workflow.
+        """
+        print(f"Reading file: {self.xml_file}")
+        self.process_json_to_csv(self.parse_xml_to_json())
+
+class DataProcessor:
+    """
+    A class to process nested JSON structures and prepare data for DataFrame creation.
+    """
+
+    @staticmethod
+    def _flatten_section(section: dict, header: str, row: dict,
+                         rows_suffix: str = 'Rows')-> None:
+        """
+        Extracts one section's tables and PARs into flat keys on a row dict.
+
+        Args:
+            section (dict): Parsed section data.
+            header (str): The section header, used as the column-name prefix.
+            row (dict): Row dict to receive the flattened values.
+            rows_suffix (str): Suffix for the table-rows key.
+        """
+        rows, updatedate = DataProcessor._process_tables(section)
+        row[f"{header}{rows_suffix}"] = rows
+        row[f"{header}UpdateDate"] = updatedate
+        row[f"{header}PARs"] = DataProcessor._process_pars(section)
+
+    @staticmethod
+    def intermediate_from_csv(csv_file: str) -> pd.DataFrame:
+        """
+        Reloads a previously written intermediate CSV and processes it.
+
+        Cells read back from CSV are stringified section dicts, so this is the
+        only path that still pays for ast.literal_eval per cell. Each record is
+        flattened into a single-level row; the final DataFrame is built once
+        from the accumulated rows and never holds dict-valued columns.
+
+        Args:
+            csv_file (str): Path to the intermediate CSV file.
+
+        Returns:
+            pd.DataFrame: Processed DataFrame with extracted and formatted data.
+        """
+        df = pd.read_csv(csv_file)
+        trimming_columns = ['PortName', 'PortID', 'WorldPortNumber']
+        section_columns = [col for col in df.columns if col not in trimming_columns]
+
+        flat_rows = []
+        for record in df.to_dict('records'):
+            row = {col: record[col] for col in trimming_columns}
+            for col in section_columns:
+                data = DataProcessor._parse_entry(record[col])
+                if data is None:
+                    row[f"{col}Rows"] = None
+                    row[f"{col}UpdateDate"] = None
+                    row[f"{col}PARs"] = ()
+                else:
+                    DataProcessor._flatten_section(data, col, row)
+            flat_rows.append(row)
+
+        return pd.DataFrame(flat_rows)
+
+    @staticmethod
+    def _parse_entry(entry)-> dict:
+        """
+        Parses a stringified entry reloaded from a CSV cell.
+
+        Args:
+            entry: The entry to be parsed.
+
+        Returns:
+            dict or None: Parsed data or None if parsing fails.
+        """
+        try:
+            if isinstance(entry, str):
+                return ast.literal_eval(entry)
+            elif isinstance(entry, dict):
+                return entry
+            return None
+        except (ValueError, SyntaxError):
+            return None
+
+    @staticmethod
+    def _process_tables(data)-> tuple:
+        """
+        Processes table data within a parsed entry.
+
+        Args:
+            data (dict): Parsed entry data.
+
+        Returns:
+            tuple: (rows, updatedate) of the first table, or (None, None).
+        """
+        tables = data.get('Tables')
+        if tables:
+            first_table = tables[0]
+            return first_table.get('Rows', []), first_table.get('updatedate', None)
+        return None, None
+
+    @staticmethod
+    def _process_pars(data: dict)-> tuple:
+        """
+        Processes PAR data within a parsed entry.
+
+        Args:
+            data (dict): Parsed entry data.
+
+        Returns:
+            tuple: (updatedate, Text) of the first PAR, or () if there are none.
+        """
+        pars = data.get('PARs')
+        if pars:
+            pars = pars[0]
+            if isinstance(pars, dict):
+                pars_dict = pars
+            elif isinstance(pars, str):
+                pars_dict = ast.literal_eval(pars)
+            else:
+                pars_dict = {}
+            # A two-slot tuple is markedly smaller and cheaper to allocate
+            # than a two-entry dict, and this runs once per (port x section)
+            return pars_dict.get('updatedate'), pars_dict.get('Text')
+        return ()